@@ -2,8 +2,13 @@
 """Converter script for Rdata format input data."""
 from argparse import ArgumentParser
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pyreadr import read_r
 
+# Number of rows converted to Arrow and written out at a time
+ROW_GROUP_SIZE = 64 * 1024
+
 
 def run() -> None:
     """Runscript to convert Rdata."""
@@ -19,8 +24,21 @@ def run() -> None:
     # Convert to dataframe
     df = datafile[None]
 
-    # Write it out to parquet
-    df.to_parquet(results.outfile)
+    # Write it out to parquet, one row group at a time, so that only a single row
+    #  group is ever held in Arrow format alongside the dataframe. The schema is
+    #  inferred from the full dataframe so that it is consistent across row groups.
+    schema = pa.Schema.from_pandas(df)
+    with pq.ParquetWriter(
+        results.outfile,
+        schema,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+        data_page_size=1 << 20,
+    ) as writer:
+        for start in range(0, len(df), ROW_GROUP_SIZE):
+            chunk = df.iloc[start : start + ROW_GROUP_SIZE]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema))
 
 
 if __name__ == "__main__":
@@ -330,3 +330,7 @@ Dx_labels_all = np.array(
         "dccd",
     ]
 )
+
+# Numbers of questions at which to re-learn models while degrading the x-set; denser at
+# the low end, where performance changes fastest (the full x-set is always included)
+N_questions_schedule = np.array([1, 2, 3, 5, 8, 13, 20, 30, 50, 75])
@@ -2,7 +2,6 @@
 """Defines the learner dataclass."""
 
 from dataclasses import dataclass, field
-from typing import List
 
 import numpy as np
 import pandas as pd
@@ -18,7 +17,9 @@ class Learner:
     x_ids: np.ndarray = field(
         default_factory=lambda: np.zeros(())
     )  # List of features used in the learner
-    fi: List = field(default_factory=lambda: list())  # Feature importance lists
+    fi: np.ndarray = field(
+        default_factory=lambda: np.zeros(())
+    )  # Feature importance per fold (folds x features)
     f1: np.ndarray = field(default_factory=lambda: np.zeros(()))  # F1 score lists
     sen: np.ndarray = field(
         default_factory=lambda: np.zeros(())
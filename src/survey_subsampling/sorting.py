@@ -17,14 +17,11 @@ def aggregate_sort(
         id_vars=["Dx"], value_vars=list(x_ids), value_name="importance"
     )
 
-    # Sort based on aggregate feature importance
-    sort_agg = (
-        melted_learners_df.groupby("variable")
-        .sum()
-        .reset_index()
-        .sort_values("importance")["variable"]
-        .values[::-1]
-    )
+    # Sort based on aggregate feature importance (summed across targets), with ties
+    #  broken by name (i.e. in reverse alphabetical order, once reversed)
+    names = np.array(x_ids)
+    importance = np.nansum(learners_dataframe[x_ids].to_numpy(), axis=0)
+    sort_agg = names[np.lexsort((names, importance))][::-1]
     return melted_learners_df, sort_agg
 
 
@@ -33,19 +30,14 @@ def topn_sort(
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Performs sorting based on topN usefulness."""
     # Redo sorting and plotting with the top-N approach
-    # Initialize an empty list of questions, to be populated iteratively.
+    # Rank the questions within each diagnosis (once, as ranks don't depend on N)
     N = len(x_ids)
-    item_relevance = np.zeros((N, len(x_ids)))
-
-    # For each threshold of "we can only include N questions..."
-    for n in range(N):
-        # Record the proportion of diagnoses for which a given question belongs
-        item_relevance[n, :] = (
-            learners_dataframe[x_ids]
-            .rank(axis=1, ascending=False)
-            .apply(lambda x: x <= n + 1)
-            .sum(axis=0)
-        )
+    ranks = learners_dataframe[x_ids].rank(axis=1, ascending=False).to_numpy()
+
+    # For each threshold of "we can only include N questions..." record the number
+    #  of diagnoses for which a given question belongs (item_relevance[n, question])
+    thresholds = np.arange(1, N + 1)[:, None, None]
+    item_relevance = (ranks[None, :, :] <= thresholds).sum(axis=1, dtype=float)
 
     # Sort the prevalance table we just built, and apply it to the questions
     idx_topn = np.lexsort(item_relevance[::-1, :])[::-1]
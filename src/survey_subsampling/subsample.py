@@ -2,22 +2,18 @@
 """Survey subsampling functions and runscript."""
 
 from argparse import ArgumentParser
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from os import PathLike, makedirs
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from os import PathLike, cpu_count, makedirs
 from os import path as op
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import (
-    accuracy_score,
-    class_likelihood_ratios,
-    classification_report,
-    f1_score,
-)
-from sklearn.model_selection import StratifiedKFold
+from sklearn.metrics import accuracy_score, confusion_matrix
+from sklearn.model_selection import StratifiedKFold, train_test_split
 
 from survey_subsampling import sorting
 from survey_subsampling.core import constants
@@ -28,58 +24,59 @@ def load_data(
     infile: PathLike, threshold: int = 50, verbose: bool = True
 ) -> Tuple[pd.DataFrame, pd.DataFrame, np.ndarray]:
     """Grabs a parquet file, extracts the columns we want, removes NaNs, and returns."""
-    # Grabs data file from disk, sets diagnostic labels to 0 or 1.
-    df_full = pd.read_parquet(infile)
-    df_full[constants.Dx_labels_all] = df_full[constants.Dx_labels_all].replace(
-        {2.0: 1, 0.0: 0}
-    )
-
-    # Define column selector utility to iteratively use to subsample the dataset.
-    def _column_selector(
-        df: pd.DataFrame, columns: np.ndarray, drop: bool = False
-    ) -> pd.DataFrame:
-        return df[columns].dropna(axis=0, how="any") if drop else df[columns]
-
-    def _get_prevalance(df: pd.DataFrame, diagnoses: np.ndarray) -> pd.DataFrame:
-        tmp = []
-        for dx in diagnoses:
-            vc = df[dx].value_counts()
-            tmp += [{"Dx": dx, "HC": vc.loc[0.0], "Pt": vc.loc[1.0]}]
-        return pd.DataFrame.from_dict(tmp).set_index("Dx").sort_values(by="Pt")
+    # Grabs survey & diagnosis columns from disk, sets diagnostic labels to 0 or 1.
+    columns = list(constants.CBCLABCL_items) + list(constants.Dx_labels_all)
+    df_full = pd.read_parquet(infile, columns=columns)
+    dx_values = df_full[constants.Dx_labels_all].to_numpy(dtype=np.float32)
+    dx_values = np.where(dx_values == 2.0, 1.0, dx_values)
+    df_full[constants.Dx_labels_all] = dx_values
+
+    # Cache the missing-data masks once, to iteratively use to subsample the dataset:
+    #  rows with a complete survey, and missing labels for each diagnosis
+    complete_items = ~df_full[constants.CBCLABCL_items].isna().to_numpy().any(axis=1)
+    missing_dx = np.isnan(dx_values)
+    dx_cols = {dx: i for i, dx in enumerate(constants.Dx_labels_all)}
+
+    def _get_prevalance(values: np.ndarray, diagnoses: np.ndarray) -> pd.DataFrame:
+        # Count HCs and Pts for all diagnoses in one pass (NaNs match neither)
+        tmp = {
+            "Dx": diagnoses,
+            "HC": (values == 0.0).sum(axis=0),
+            "Pt": (values == 1.0).sum(axis=0),
+        }
+        return pd.DataFrame(tmp).set_index("Dx").sort_values(by="Pt")
 
     # Initialize the dataset cleaning
-    # Subset table based on all diagnoses, compute prevalance
-    df = _column_selector(
-        df_full,
-        np.append(constants.CBCLABCL_items, constants.Dx_labels_all),
-        drop=False,
-    )
-    df_prev = _get_prevalance(df, diagnoses=constants.Dx_labels_all)
+    # Compute prevalance across all diagnoses on the sparse dataset
+    df_prev = _get_prevalance(dx_values, diagnoses=constants.Dx_labels_all)
 
     # Drop low-prevalance diagnoses right away from sparse dataset
     #        full list of diagnoses  -  all diagnoses with low prevalance
-    Dx_labels_subset = np.array(
-        list(set(df_prev.index) - set(df_prev[df_prev["Pt"] < threshold].index))
-    )
+    Dx_labels_subset = df_prev.index.difference(
+        df_prev[df_prev["Pt"] < threshold].index
+    ).to_numpy()
 
     # Prepare to iteratively repeat the process as the total N for each Dx may
     # change as we prune missing data and change the included column lists
     low_N = True
     while low_N:
-        # Repeat dataset table subsetting (densely this time) and drop low N
-        df = _column_selector(
-            df_full, np.append(constants.CBCLABCL_items, Dx_labels_subset), drop=True
-        )
-        df_prev = _get_prevalance(df, diagnoses=Dx_labels_subset)
+        # Repeat dataset row selection (densely this time: rows with a complete survey
+        #  and labels for all included diagnoses) and drop low N
+        cols = [dx_cols[dx] for dx in Dx_labels_subset]
+        rows = complete_items & ~missing_dx[:, cols].any(axis=1)
+        df_prev = _get_prevalance(dx_values[rows][:, cols], diagnoses=Dx_labels_subset)
 
         # Grab a dataframe of the low-prevalance diagnoses...
         low_N_df = df_prev[df_prev["Pt"] < threshold]
         if low_N := (len(low_N_df.index) > 0):
             # ... and remove them from the set of consideration, then go again
-            Dx_labels_subset = np.array(
-                list(set(Dx_labels_subset) - set(low_N_df.index))
+            Dx_labels_subset = (
+                pd.Index(Dx_labels_subset).difference(low_N_df.index).to_numpy()
             )
 
+    # Subset the table to the selected rows, survey items, and diagnoses
+    df = df_full.loc[rows, np.append(constants.CBCLABCL_items, Dx_labels_subset)]
+
     # Report on prevalance table and overall dataset length
     if verbose:
         print(df_prev)
@@ -89,38 +86,70 @@ def load_data(
     return df, df_prev, Dx_labels_subset
 
 
+def _binary_scores(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> Tuple[float, float, float, float, float]:
+    """Computes F1, sensitivity, specificity, LR+, and LR- from one confusion matrix."""
+    tn, fp, fn, tp = confusion_matrix(y_true, y_pred, labels=[0, 1]).ravel()
+
+    # Zero-division cases follow sklearn: 0 for F1 and recalls, NaN for the ratios
+    f1 = 2 * tp / (2 * tp + fp + fn) if tp + fp + fn > 0 else 0.0
+    sen = tp / (tp + fn) if tp + fn > 0 else 0.0
+    spe = tn / (tn + fp) if tn + fp > 0 else 0.0
+    lrp = sen / (1 - spe) if fp > 0 and tp + fn > 0 else np.nan
+    lrn = (1 - sen) / spe if tn > 0 and tp + fn > 0 else np.nan
+    return f1, sen, spe, lrp, lrn
+
+
 def fit_models(
-    df: pd.DataFrame, x_ids: np.ndarray, y_ids: np.ndarray, verbose: bool = True
+    X: np.ndarray,
+    Y: np.ndarray,
+    x_ids: np.ndarray,
+    y_ids: np.ndarray,
+    verbose: bool = True,
+    n_jobs: int = -1,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """General purpose function for fitting callibrated classifiers."""
+    # X (feature) and Y (target) matrices hold one column per entry of x_ids and y_ids
     # Establish Models & Cross-Validation Strategy
     #   Base clf: Random Forest. Rationale: non-parametric, has feature importance
-    clf_rf = RandomForestClassifier(n_estimators=100, class_weight="balanced")
+    #   (trees are fit and evaluated in parallel across n_jobs cores)
+    clf_rf = RandomForestClassifier(
+        n_estimators=100, class_weight="balanced", n_jobs=n_jobs
+    )
     #   CV: Stratified K-fold. Rationale: shuffle data, balance classes across folds
     cv = StratifiedKFold(shuffle=True, random_state=42)
-    #   Top-level clf: Calibrated CV classifier.
-    #   Rationale: prioritizes maintaining class balances
-    clf_calib = CalibratedClassifierCV(estimator=clf_rf, cv=cv)
+    #   Top-level clf: Calibrated classifier, fit on a held-out slice of each
+    #   training fold. Rationale: prioritizes maintaining class balances, while
+    #   fitting a single forest per fold rather than one per internal CV fold
+    clf_calib = CalibratedClassifierCV(estimator=clf_rf, cv="prefit", method="isotonic")
     np.random.seed(42)
 
-    # Create X (feature) matrix: grab relevant survey columns x rows from dataframe
-    X = df[x_ids].values
+    # Precompute the (stratified, so Dx-specific) CV splits for every Dx up front
+    splits = [list(cv.split(X, Y[:, y_idx])) for y_idx in range(len(y_ids))]
 
-    # Create empty list of learners
-    learners = []
+    # Create empty table of learner feature importances (Dx x feature), and summaries
+    learners = np.empty((len(y_ids), len(x_ids)), dtype=np.float32)
     summaries = []
     # For every Dx that we want to predict...
-    for y_name in y_ids:
-        # Create the y (target) matrix/vector: grab relevant Dx rows from dataframe
-        y = df[y_name].values.astype(int)
+    for y_idx, y_name in enumerate(y_ids):
+        # Grab the y (target) vector: the relevant Dx column of the target matrix
+        y = Y[:, y_idx]
 
         # Get Pt and HC counts from dataframe, and initialize the learner object
         _, uc = np.unique(y, return_counts=True)
 
         current_learner = Learner(dx=y_name, hc_n=uc[0], dx_n=uc[1], x_ids=x_ids)
-        # Set-up a CV loop (note, we use the same CV strategy both within the
-        #  Calibrated CLF and here, resulting in nested-stratified-k-fold-CV)
-        for idx_train, idx_test in cv.split(X, y):
+
+        # Accumulate per-fold scores in lists, and fill out-of-fold predictions in
+        #  place (every sample lands in exactly one test fold)
+        acc_train, acc_valid, f1, sen, spe, LRp, LRn = [], [], [], [], [], [], []
+        proba = np.empty((len(y), 2), dtype=float)
+        label = np.empty(len(y), dtype=y.dtype)
+        fi = np.empty((cv.get_n_splits(), len(x_ids)), dtype=np.float32)
+
+        # Set-up a stratified-k-fold-CV loop
+        for fold, (idx_train, idx_test) in enumerate(splits[y_idx]):
             # Split the dataset into train and test sets
             X_tr = X[idx_train, :]
             y_tr = y[idx_train]
@@ -128,67 +157,68 @@ def fit_models(
             X_te = X[idx_test, :]
             y_te = y[idx_test]
 
-            # Fit the callibrated classifier on the training data
-            clf_calib.fit(X_tr, y_tr)
-
-            # Extract/Generate relevant data from (all internal folds of) the clf...
-            # Make predictions on the test set
-            y_pred = clf_calib.predict(X_te)
-
-            # Grab training and validation perf using the integrated scoring (accuracy)
-            y_pred_tr = clf_calib.predict(X_tr)
-            current_learner.acc_train = np.append(
-                current_learner.acc_train, accuracy_score(y_tr, y_pred_tr)
+            # Hold out a stratified slice of the training data for calibration
+            X_fit, X_cal, y_fit, y_cal = train_test_split(
+                X_tr, y_tr, test_size=0.2, stratify=y_tr, random_state=42
             )
-            current_learner.acc_valid = np.append(
-                current_learner.acc_valid, accuracy_score(y_te, y_pred)
+
+            # Fit the forest, and then the callibrated classifier on top of it
+            clf_rf.fit(X_fit, y_fit)
+            clf_calib.fit(X_cal, y_cal)
+
+            # Extract/Generate relevant data from the clf...
+            # Make predictions on the test set, deriving labels from the probabilities
+            #  (as the calibrated clf's predict would) to traverse the forest once
+            proba_te = clf_calib.predict_proba(X_te)
+            y_pred = clf_calib.classes_[np.argmax(proba_te, axis=1)]
+
+            # Grab training and validation perf using the integrated scoring (accuracy);
+            #  training perf is scored on a fixed, stratified, test-sized subsample of
+            #  the training data, rather than a full pass of the forest over it
+            X_sub, _, y_sub, _ = train_test_split(
+                X_tr, y_tr, train_size=len(y_te), stratify=y_tr, random_state=42
             )
+            y_pred_tr = clf_calib.predict(X_sub)
+            acc_train.append(accuracy_score(y_sub, y_pred_tr))
+            acc_valid.append(accuracy_score(y_te, y_pred))
 
             # Grab feature importance scores
-            fis = [
-                _.estimator.feature_importances_
-                for _ in clf_calib.calibrated_classifiers_
-            ]
-            current_learner.fi.append(fis)
+            fi[fold] = clf_rf.feature_importances_
 
             # Grab the prediction probabilities
-            current_learner.proba = np.append(
-                current_learner.proba, clf_calib.predict_proba(X_te)
-            )
-            current_learner.label = np.append(current_learner.label, y_te)
-
-            # Grab the prediction labels
-            current_learner.f1 = np.append(current_learner.f1, f1_score(y_te, y_pred))
-
-            # Grab the sensitivity and specificity (i.e. recall of each of Dx and HC)
-            report_dict = classification_report(y_te, y_pred, output_dict=True)
-            current_learner.sen = np.append(
-                current_learner.sen, report_dict["1"]["recall"]
-            )
-            current_learner.spe = np.append(
-                current_learner.spe, report_dict["0"]["recall"]
-            )
-
-            # Grab the positive/negative likelihood ratios
-            lrp, lrn = class_likelihood_ratios(y_te, y_pred)
-            current_learner.LRp = np.append(current_learner.LRp, lrp)
-            current_learner.LRn = np.append(current_learner.LRn, lrn)
+            proba[idx_test] = proba_te
+            label[idx_test] = y_te
+
+            # Grab the F1, sensitivity and specificity (i.e. recall of each of Dx and
+            #  HC), and positive/negative likelihood ratios of the prediction labels
+            f1_, sen_, spe_, lrp, lrn = _binary_scores(y_te, y_pred)
+            f1.append(f1_)
+            sen.append(sen_)
+            spe.append(spe_)
+            LRp.append(lrp)
+            LRn.append(lrn)
+
+        # Store the per-fold scores and predictions on the learner
+        current_learner.acc_train = np.asarray(acc_train)
+        current_learner.acc_valid = np.asarray(acc_valid)
+        current_learner.f1 = np.asarray(f1)
+        current_learner.sen = np.asarray(sen)
+        current_learner.spe = np.asarray(spe)
+        current_learner.LRp = np.asarray(LRp)
+        current_learner.LRn = np.asarray(LRn)
+        current_learner.fi = fi
+        current_learner.proba = proba
+        current_learner.label = label
 
         # Summarize current learner performance, save it, and get ready to go again!
         summaries += [current_learner.summary()]
-
-        tmp_learner = {"Dx": current_learner.dx}
-
-        means = np.mean(np.vstack(current_learner.fi), axis=0)  # type: ignore[call-overload]
-        for assessment, importance in zip(x_ids, means):
-            tmp_learner[assessment] = importance
-        learners += [tmp_learner]
-
-        del current_learner
+        learners[y_idx] = current_learner.fi.mean(axis=0)
 
     # Improve formatting of summaries and complete learners
     summaries = pd.concat(summaries).set_index("Dx")
-    learners = pd.DataFrame.from_dict(learners).set_index("Dx")
+    learners = pd.DataFrame(
+        learners, index=pd.Index(y_ids, name="Dx"), columns=pd.Index(x_ids)
+    )
 
     return learners, summaries
 
@@ -224,39 +254,107 @@ def calculate_feature_importance(
     print(f"The two lists differ by {diff} / {number_of_questions} items ({frac:.2f}%)")
 
     # Compute the average position across the two methods
-    avg_rank = np.mean(
-        np.where(x_ids_sorted_by_aggregate[:, None] == x_ids_sorted_by_topn), axis=0
+    pos_topn = {name: i for i, name in enumerate(x_ids_sorted_by_topn)}
+    avg_rank = np.array(
+        [
+            (pos_agg + pos_topn[name]) / 2
+            for pos_agg, name in enumerate(x_ids_sorted_by_aggregate)
+        ]
     )
     x_ids_sorted_average = x_ids_sorted_by_aggregate[np.argsort(avg_rank)]
 
     return x_ids_sorted_by_aggregate, x_ids_sorted_by_topn, x_ids_sorted_average
 
 
+# Per-process handles on the feature matrix shared with degrading_fit's workers
+_shared: Dict[str, Any] = {}
+
+
+def _attach_shared(
+    shm_name: str, shape: Tuple[int, ...], dtype: np.dtype, Y: np.ndarray
+) -> None:
+    """Pool initializer attaching a worker to the shared feature matrix."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _shared["shm"] = shm  # Keep the block open for the lifetime of the worker
+    _shared["X"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _shared["Y"] = Y
+
+
+def _fit_models_shared(
+    cols: np.ndarray, x_ids: np.ndarray, y_ids: np.ndarray, n_jobs: int = -1
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Runs fit_models on a subset of columns of the shared feature matrix."""
+    X = _shared["X"][:, cols]
+    return fit_models(X, _shared["Y"], x_ids, y_ids, verbose=False, n_jobs=n_jobs)
+
+
 def degrading_fit(
-    df: pd.DataFrame,
+    X: np.ndarray,
+    Y: np.ndarray,
+    x_ids: np.ndarray,
     sorted_x_ids: np.ndarray,
     y_ids: np.ndarray,
     threads: int = 4,
     verbose: bool = True,
+    schedule: Optional[np.ndarray] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Wrapper for fit_models that degrades the performance by reducing the x-set."""
     # Initiatlize some storage containers
     degraded_tuple = []
-    futures = []
-
-    with ProcessPoolExecutor(max_workers=threads) as pool:
-        # For each number of questions (from the length of sorted_x_ids down to 1)...
-        for n_questions in range(len(sorted_x_ids))[::-1]:
-            # Grab the first n_questions from the sorted list
-            xi = sorted_x_ids[0 : n_questions + 1]
-
-            # Add the diagnostic prediction models to the queue using this reduced x-set
-            #   Equiv command: degraded_tuple = fit_models(df, xi, y_ids, verbose=False)
-            futures.append(pool.submit(fit_models, df, xi, y_ids, verbose=False))
-
-    # Store the results as they come in
-    for future in as_completed(futures):
-        degraded_tuple.append(future.result())
+    pending = set()
+
+    # Only re-learn at the scheduled numbers of questions (plus the full x-set), as
+    #  neighbouring x-set sizes give near-identical models; N_xs in the summaries
+    #  records the size of each x-set for plotting/interpolation
+    if schedule is None:
+        schedule = constants.N_questions_schedule
+    n_total = len(sorted_x_ids)
+    n_qs = sorted({int(n) for n in schedule if 0 < n < n_total} | {n_total})
+
+    # Map the sorted x-set onto column positions of the feature matrix
+    col_idx = {name: i for i, name in enumerate(x_ids)}
+    sorted_cols = np.array([col_idx[name] for name in sorted_x_ids])
+
+    # Share the available cores between the workers and their forests, rather than
+    #  oversubscribing them with a full pool of multi-threaded forests
+    n_jobs = max(1, (cpu_count() or 1) // threads)
+
+    # Place the feature matrix in shared memory once, so that the workers attach to it
+    #  rather than each task pickling (a subset of) it
+    shm = shared_memory.SharedMemory(create=True, size=X.nbytes)
+    try:
+        np.ndarray(X.shape, dtype=X.dtype, buffer=shm.buf)[:] = X
+
+        with ProcessPoolExecutor(
+            max_workers=threads,
+            initializer=_attach_shared,
+            initargs=(shm.name, X.shape, X.dtype, Y),
+        ) as pool:
+            # For each number of questions (from the length of sorted_x_ids down to 1;
+            #  the largest, slowest x-sets go first so they don't trail at the end)...
+            for n_questions in n_qs[::-1]:
+                # Grab the first n_questions from the sorted list
+                xi = sorted_x_ids[0:n_questions]
+                cols = sorted_cols[0:n_questions]
+
+                # Add the diagnostic prediction models to the queue using this x-set
+                #   Equiv command: fit_models(X[:, cols], Y, xi, y_ids, verbose=False)
+                pending.add(
+                    pool.submit(_fit_models_shared, cols, xi, y_ids, n_jobs=n_jobs)
+                )
+
+                # Keep a bounded queue, storing the results as they come in
+                if len(pending) >= 2 * threads:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    degraded_tuple += [future.result() for future in done]
+
+            # Store the remaining results as they come in
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                degraded_tuple += [future.result() for future in done]
+    finally:
+        shm.close()
+        shm.unlink()
 
     # Separate the learners and respective summaries
     degraded_learners = [dt[0] for dt in degraded_tuple]
@@ -268,6 +366,17 @@ def degrading_fit(
     return degraded_learners, degraded_summaries
 
 
+def _write_parquet(df: pd.DataFrame, path: str) -> None:
+    """Writes a dataframe to parquet with zstd compression and dictionary encoding."""
+    df.to_parquet(
+        path,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+    )
+
+
 def run() -> None:
     """CLI runscript for subsampling."""
     # TODO: improve docstrings, helptext, and the like
@@ -306,20 +415,32 @@ def run() -> None:
         infile, threshold=threshold, verbose=verbose
     )
 
+    # Convert the survey items and diagnoses to (contiguous) matrices once, up front,
+    #  in the single-precision format that the forests use internally
+    X = np.ascontiguousarray(df[constants.CBCLABCL_items].to_numpy(dtype=np.float32))
+    Y = df[Dx_labels_subset].to_numpy(dtype=np.int8)
+
     # Establish baseline prediction, and further remove diagnostic labels for which the
     #  models fail to make reasonable predictions (read as: make predictions to both
     #  classes; identifiable as diagnoses with a NaN for LR+)
     learners, summaries = fit_models(
-        df, constants.CBCLABCL_items, Dx_labels_subset, verbose=verbose
+        X,
+        Y,
+        constants.CBCLABCL_items,
+        Dx_labels_subset,
+        verbose=verbose,
+        n_jobs=-1,
     )
-    Dx_labels_subset = np.array(
-        list(set(Dx_labels_subset) - set(summaries[summaries["LR+"].isna()].index))
+    Dx_labels_subset = (
+        pd.Index(Dx_labels_subset)
+        .difference(summaries[summaries["LR+"].isna()].index)
+        .to_numpy()
     )
     learners = learners.loc[Dx_labels_subset]
-    learners.to_parquet(f"{outdir}/learners.parquet")
+    _write_parquet(learners, f"{outdir}/learners.parquet")
 
     summaries = summaries.loc[Dx_labels_subset]
-    summaries.to_parquet(f"{outdir}/summaries.parquet")
+    _write_parquet(summaries, f"{outdir}/summaries.parquet")
     if verbose:
         print(summaries)
 
@@ -330,14 +451,21 @@ def run() -> None:
     importance = pd.DataFrame(
         {"Aggregate": sorted_agg, "Top-N": sorted_topn, "Average": sorted_avg}
     )
-    importance.to_parquet(f"{outdir}/feature_importance.parquet")
+    _write_parquet(importance, f"{outdir}/feature_importance.parquet")
 
     # Redo the learning process with a degrading set of data
+    Y = df[Dx_labels_subset].to_numpy(dtype=np.int8)
     learners_deg, summaries_deg = degrading_fit(
-        df, sorted_avg, Dx_labels_subset, threads=nt, verbose=verbose
+        X,
+        Y,
+        constants.CBCLABCL_items,
+        sorted_avg,
+        Dx_labels_subset,
+        threads=nt,
+        verbose=verbose,
     )
-    summaries_deg.to_parquet(f"{outdir}/summaries_degraded.parquet")
-    learners_deg.to_parquet(f"{outdir}/learners_degraded.parquet")
+    _write_parquet(summaries_deg, f"{outdir}/summaries_degraded.parquet")
+    _write_parquet(learners_deg, f"{outdir}/learners_degraded.parquet")
 
 
 if __name__ == "__main__":
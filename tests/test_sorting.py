@@ -0,0 +1,74 @@
+"""Tests for the sorting approaches."""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey_subsampling import sorting
+
+X_IDS = np.array([f"cl{i}" for i in range(40)])
+DX_IDS = pd.Index([f"dx{i}" for i in range(8)], name="Dx")
+
+
+def _learners(seed: int, ties: bool) -> pd.DataFrame:
+    """Builds a random learners table, optionally with (exactly) tied importances."""
+    rng = np.random.default_rng(seed)
+    shape = (len(DX_IDS), len(X_IDS))
+    # Quarters are exact in floating point, so ties survive any summation order
+    values = rng.integers(0, 4, shape) / 4 if ties else rng.random(shape)
+    return pd.DataFrame(values, index=DX_IDS, columns=X_IDS)
+
+
+def _reference_aggregate_sort(learners: pd.DataFrame, x_ids: np.ndarray) -> np.ndarray:
+    """Groupby-based aggregate sort, ordering ties by (reversed) name."""
+    melted = learners.reset_index().melt(
+        id_vars=["Dx"], value_vars=list(x_ids), value_name="importance"
+    )
+    return (
+        melted.groupby("variable")
+        .sum()
+        .reset_index()
+        .sort_values("importance", kind="stable")["variable"]
+        .values[::-1]
+    )
+
+
+def _reference_topn_sort(
+    learners: pd.DataFrame, x_ids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Loop-based top-N sort, re-ranking the table for every N."""
+    N = len(x_ids)
+    item_relevance = np.zeros((N, len(x_ids)))
+    for n in range(N):
+        item_relevance[n, :] = (
+            learners[x_ids]
+            .rank(axis=1, ascending=False)
+            .apply(lambda x: x <= n + 1)
+            .sum(axis=0)
+        )
+    idx_topn = np.lexsort(item_relevance[::-1, :])[::-1]
+    return item_relevance, np.array(x_ids)[idx_topn], idx_topn
+
+
+@pytest.mark.parametrize("ties", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_aggregate_sort_matches_reference(seed: int, ties: bool) -> None:
+    """The aggregate sort, including ties, matches the groupby implementation."""
+    learners = _learners(seed, ties)
+    melted, sort_agg = sorting.aggregate_sort(learners, X_IDS)
+
+    assert len(melted) == len(DX_IDS) * len(X_IDS)
+    np.testing.assert_array_equal(sort_agg, _reference_aggregate_sort(learners, X_IDS))
+
+
+@pytest.mark.parametrize("ties", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_topn_sort_matches_reference(seed: int, ties: bool) -> None:
+    """The top-N sort, including tied ranks, matches the loop implementation."""
+    learners = _learners(seed, ties)
+    for result, expected in zip(
+        sorting.topn_sort(learners, X_IDS), _reference_topn_sort(learners, X_IDS)
+    ):
+        np.testing.assert_array_equal(result, expected)
@@ -0,0 +1,51 @@
+"""Tests for the subsampling functions."""
+
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.metrics import class_likelihood_ratios, classification_report, f1_score
+
+from survey_subsampling.subsample import _binary_scores
+
+
+def _sklearn_scores(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> tuple[float, float, float, float, float]:
+    """Computes the binary scores via the sklearn functions they replace."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        report = classification_report(
+            y_true, y_pred, labels=[0, 1], output_dict=True, zero_division=0
+        )
+        lrp, lrn = class_likelihood_ratios(y_true, y_pred, labels=[0, 1])
+        f1 = f1_score(y_true, y_pred, zero_division=0)
+    return f1, report["1"]["recall"], report["0"]["recall"], lrp, lrn
+
+
+@pytest.mark.parametrize(
+    "y_true, y_pred",
+    [
+        pytest.param([0, 1, 1, 0, 1, 0], [0, 1, 0, 1, 1, 0], id="mixed"),
+        pytest.param([0, 1, 1, 0, 1, 0], [0, 0, 0, 0, 0, 0], id="all-negative"),
+        pytest.param([0, 1, 1, 0, 1, 0], [1, 1, 1, 1, 1, 1], id="all-positive"),
+        pytest.param([1, 1, 1, 1], [1, 0, 1, 1], id="only-patients"),
+        pytest.param([0, 0, 0, 0], [0, 1, 0, 0], id="only-controls"),
+        pytest.param([0, 1, 1, 0, 1, 0], [0, 1, 1, 0, 1, 0], id="perfect"),
+    ],
+)
+def test_binary_scores_match_sklearn(y_true: list, y_pred: list) -> None:
+    """Scores, including zero-division cases, match the sklearn metrics."""
+    yt, yp = np.array(y_true), np.array(y_pred)
+    np.testing.assert_allclose(_binary_scores(yt, yp), _sklearn_scores(yt, yp))
+
+
+def test_binary_scores_match_sklearn_random() -> None:
+    """Scores match the sklearn metrics on random (often degenerate) labels."""
+    rng = np.random.default_rng(42)
+    for _ in range(500):
+        n = rng.integers(2, 12)
+        y_true, y_pred = rng.integers(0, 2, n), rng.integers(0, 2, n)
+        np.testing.assert_allclose(
+            _binary_scores(y_true, y_pred), _sklearn_scores(y_true, y_pred)
+        )